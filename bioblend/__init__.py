@@ -125,6 +125,13 @@ class NotReady(Exception):
     pass
 
 
+class WaitCancelled(Exception):
+    """
+    An exception raised by a waiting method when the wait is cancelled from
+    another thread, as opposed to timing out.
+    """
+
+
 T = TypeVar("T")
 
 
@@ -143,14 +150,14 @@ def wait_on(func: Callable[[], T], maxwait: float = 60, interval: float = 3) ->
     assert maxwait >= 0
     assert interval > 0
 
-    time_left = maxwait
+    deadline = time.monotonic() + maxwait
     while True:
         try:
             return func()
         except NotReady as e:
+            time_left = deadline - time.monotonic()
             if time_left > 0:
                 log.info("%s. Will wait %s more s", e, time_left)
                 time.sleep(min(time_left, interval))
-                time_left -= interval
             else:
                 raise TimeoutException(f"{e} after {maxwait} s")
@@ -1,11 +1,21 @@
 import contextlib
 import os
+import threading
 import time
+import unittest
 from typing import (
     Any,
     Dict,
+    List,
+    Optional,
 )
+from unittest import mock
 
+import pytest
+
+import bioblend
+from bioblend.galaxy import GalaxyInstance
+from bioblend.galaxy.invocations import WaitMode
 from . import (
     GalaxyTestBase,
     test_util,
@@ -79,6 +89,62 @@ class TestGalaxyInvocations(GalaxyTestBase.GalaxyTestBase):
 
         self.gi.histories.delete_history(hist2_id, purge=True)
 
+    @test_util.skip_unless_galaxy("release_20.01")
+    def test_get_invocations_with_summaries(self):
+        invocation = self._invoke_workflow()
+        self.gi.invocations.wait_for_invocation(invocation["id"])
+        invocs = self.gi.invocations.get_invocations_with_summaries(history_id=self.history_id)
+        assert len(invocs) == 1
+        assert invocs[0]["id"] == invocation["id"]
+        assert invocs[0]["summary"]["populated_state"] == "ok"
+
+    @test_util.skip_unless_galaxy("release_20.01")
+    def test_iter_invocations(self):
+        invocation = self._invoke_workflow()
+        self.gi.invocations.wait_for_invocation(invocation["id"])
+        invocation_ids = [inv["id"] for inv in self.gi.invocations.iter_invocations(history_id=self.history_id)]
+        assert invocation_ids == [invocation["id"]]
+
+    @test_util.skip_unless_galaxy("release_19.09")
+    def test_wait_for_invocation_modes(self):
+        modes: List[WaitMode] = ["poll", "auto"]
+        for mode in modes:
+            invocation = self._invoke_workflow()
+            invocation = self.gi.invocations.wait_for_invocation(invocation["id"], mode=mode)
+            assert invocation["state"] == "scheduled"
+
+    @test_util.skip_unless_galaxy("release_19.09")
+    def test_wait_for_invocations(self):
+        invoc1 = self._invoke_workflow()
+        invoc2 = self._invoke_workflow()
+        invocations = self.gi.invocations.wait_for_invocations([invoc1["id"], invoc2["id"]])
+        assert set(invocations) == {invoc1["id"], invoc2["id"]}
+        for invocation in invocations.values():
+            assert invocation["state"] == "scheduled"
+
+    @test_util.skip_unless_galaxy("release_19.09")
+    def test_invoke_and_wait(self):
+        dataset = {"src": "hda", "id": self.dataset_id}
+        result = self.gi.invocations.invoke_and_wait(
+            self.workflow_id,
+            inputs={"Input 1": dataset, "Input 2": dataset},
+            history_id=self.history_id,
+            inputs_by="name",
+        )
+        assert result["invocation"]["state"] == "scheduled"
+        for dataset_details in result["outputs"].values():
+            assert dataset_details["id"]
+        for collection_details in result["output_collections"].values():
+            assert collection_details["id"]
+
+    @test_util.skip_unless_galaxy("release_19.09")
+    def test_get_invocation_job_state_counts(self):
+        invocation = self._invoke_workflow()
+        self.gi.invocations.wait_for_invocation(invocation["id"])
+        counts = self.gi.invocations.get_invocation_job_state_counts(invocation["id"])
+        assert counts["populated_states"] == {"ok": 1}
+        assert sum(counts["states"].values()) == 1
+
     @test_util.skip_unless_galaxy("release_19.09")
     def test_get_invocation_report(self):
         invocation = self._invoke_workflow()
@@ -157,3 +223,72 @@ class TestGalaxyInvocations(GalaxyTestBase.GalaxyTestBase):
             inputs={"0": {"src": "hda", "id": self.dataset_id}},
             history_id=self.history_id,
         )
+
+
+class TestInvocationClientOffline(unittest.TestCase):
+    """
+    Tests for InvocationClient behaviour which does not require a connection
+    to a Galaxy server, with the HTTP layer stubbed out.
+    """
+
+    def setUp(self):
+        self.gi = GalaxyInstance("http://localhost:8080", key="fake_key")
+        self.client = self.gi.invocations
+
+    def test_show_invocation_caching(self):
+        invocation = {"id": "inv_id", "state": "scheduled", "inputs": {"0": {"id": "dataset_id", "src": "hda"}}}
+        with mock.patch.object(self.client, "_get", return_value=invocation) as mocked_get:
+            assert self.client.show_invocation("inv_id") == invocation
+            # The invocation is in a terminal state, so the second call must
+            # be served from the cache
+            assert self.client.show_invocation("inv_id") == invocation
+            assert mocked_get.call_count == 1
+            # Mutating the returned dict must not corrupt the cached entry
+            shown = self.client.show_invocation("inv_id")
+            shown["inputs"]["0"]["id"] = "another_dataset_id"
+            assert self.client.show_invocation("inv_id")["inputs"]["0"]["id"] == "dataset_id"
+            assert mocked_get.call_count == 1
+            # Invalidating the entry must force a fresh fetch
+            self.client.invalidate_invocation("inv_id")
+            self.client.show_invocation("inv_id")
+            assert mocked_get.call_count == 2
+
+    def test_get_invocation_job_state_counts(self):
+        step_jobs_summary = [
+            {"id": "job1", "model": "Job", "populated_state": "ok", "states": {"ok": 2}},
+            {"id": "job2", "model": "Job", "populated_state": "ok", "states": {"ok": 1, "running": 1}},
+            {"id": "job3", "model": "Job", "populated_state": "failed", "states": {}},
+        ]
+        with mock.patch.object(self.client, "_get", return_value=step_jobs_summary):
+            counts = self.client.get_invocation_job_state_counts("inv_id")
+        assert counts == {"states": {"ok": 3, "running": 1}, "populated_states": {"ok": 2, "failed": 1}}
+
+    def test_wait_for_invocation_timeout(self):
+        with mock.patch.object(self.client, "_get", return_value={"id": "inv_id", "state": "new"}):
+            with pytest.raises(bioblend.TimeoutException):
+                self.client.wait_for_invocation("inv_id", maxwait=0.25, interval=0.1)
+
+    def test_wait_for_invocation_invalid_mode(self):
+        with pytest.raises(ValueError):
+            self.client.wait_for_invocation("inv_id", mode="yell")  # type: ignore[arg-type]
+
+    def test_cancel_waits(self):
+        with mock.patch.object(self.client, "_get", return_value={"id": "inv_id", "state": "new"}):
+            timer = threading.Timer(0.2, self.client.cancel_waits)
+            timer.start()
+            try:
+                with pytest.raises(bioblend.WaitCancelled):
+                    self.client.wait_for_invocation("inv_id")
+            finally:
+                timer.cancel()
+
+    def test_wait_for_invocations_deduplicates(self):
+        def fake_get(url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+            return {"id": url.rsplit("/", 1)[1], "state": "scheduled"}
+
+        with mock.patch.object(self.client, "_get", side_effect=fake_get):
+            invocations = self.client.wait_for_invocations(["inv1", "inv2", "inv1"])
+        assert set(invocations) == {"inv1", "inv2"}
+        for invocation_id, invocation in invocations.items():
+            assert invocation["id"] == invocation_id
+            assert invocation["state"] == "scheduled"
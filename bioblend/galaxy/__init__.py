@@ -110,6 +110,15 @@ class GalaxyInstance(GalaxyClient):
         self.folders = folders.FoldersClient(self)
         self.tool_dependencies = tool_dependencies.ToolDependenciesClient(self)
 
+    def close(self) -> None:
+        """
+        Close the network resources held by this instance: the session used to
+        issue requests and the HTTP/2 client optionally used by the
+        invocations client.
+        """
+        self.invocations.close()
+        super().close()
+
     def __repr__(self) -> str:
         """
         A nicer representation of this GalaxyInstance object
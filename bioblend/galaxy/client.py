@@ -20,6 +20,22 @@ import bioblend
 # ConnectionError class was originally defined here
 from bioblend import ConnectionError  # noqa: I202
 
+try:
+    # Decode JSON responses with orjson if available: it is considerably
+    # faster than the stdlib json module on large payloads (e.g. invocations
+    # with step details) and releases the GIL while parsing
+    import orjson
+
+    def _json_loads(content: bytes) -> Any:
+        return orjson.loads(content)
+
+except ImportError:
+    import json
+
+    def _json_loads(content: bytes) -> Any:
+        return json.loads(content)
+
+
 if TYPE_CHECKING:
     from bioblend.galaxyclient import GalaxyClient
 
@@ -123,7 +139,7 @@ class Client:
                         msg = "GET: empty response"
                     else:
                         try:
-                            return r.json()
+                            return _json_loads(r.content)
                         except ValueError:
                             msg = f"GET: invalid JSON : {r.content!r}"
                 else:
@@ -2,39 +2,130 @@
 Contains possible interactions with the Galaxy workflow invocations
 """
 
+import copy
+import functools
 import logging
+import math
+import random
+import shutil
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Any,
+    Callable,
     Dict,
+    Iterator,
     List,
+    Literal,
     Optional,
+    Tuple,
     TYPE_CHECKING,
 )
 
+import requests
+
 from bioblend import (
     CHUNK_SIZE,
     ConnectionError,
     NotReady,
+    TimeoutException,
     wait_on,
+    WaitCancelled,
+)
+from bioblend.galaxy.client import (
+    _json_loads,
+    Client,
 )
-from bioblend.galaxy.client import Client
 from bioblend.galaxy.workflows import InputsBy
 
+try:
+    # Optional: used by iter_invocations() to stream-parse large invocation
+    # listings instead of materializing the whole response at once
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # Optional: if installed with HTTP/2 support (``pip install httpx[http2]``),
+    # concurrent invocation state checks are multiplexed over a single HTTP/2
+    # connection instead of one TCP+TLS connection per worker thread
+    import httpx
+except ImportError:
+    httpx = None
+
 if TYPE_CHECKING:
     from bioblend.galaxy import GalaxyInstance
 
 log = logging.getLogger(__name__)
 
-INVOCATION_TERMINAL_STATES = {"cancelled", "failed", "scheduled"}
+INVOCATION_TERMINAL_STATES = frozenset({"cancelled", "failed", "scheduled"})
 # Invocation non-terminal states are: "cancelling", "new", "ready"
 
+# Server-side timeout (in seconds) requested for each long-polling call
+LONGPOLL_SERVER_TIMEOUT = 30
+
+# TTL (in seconds) for cached details of invocations in a non-terminal state
+SHOW_CACHE_TTL = 2
+# Maximum number of invocations cached per client
+SHOW_CACHE_MAXSIZE = 1024
+
+# Maximum number of invocation base URLs cached per client
+URL_CACHE_MAXSIZE = 256
+
+WaitMode = Literal["auto", "poll", "longpoll"]
+
+
+def _make_sub_resource_getter(name: str, suffix: str, doc: str) -> Callable[..., Any]:
+    """
+    Generate a method fetching an invocation sub-resource, with the URL
+    template baked into the closure at class-definition time.
+    """
+    tmpl = "{base}/" + suffix
+
+    def getter(self: "InvocationClient", invocation_id: str) -> Any:
+        return self._get(url=tmpl.format(base=self._inv_url(invocation_id)))
+
+    getter.__name__ = name
+    getter.__qualname__ = f"InvocationClient.{name}"
+    getter.__doc__ = doc
+    return getter
+
 
 class InvocationClient(Client):
     gi: "GalaxyInstance"
     module = "invocations"
 
+    # URL templates for invocation sub-resources, filled in with the cached
+    # per-invocation base URL. The simple GET getters instead bake their
+    # template into a closure, see _make_sub_resource_getter().
+    _REPORT_PDF_TMPL = "{base}/report.pdf"
+    _PREPARE_STORE_DOWNLOAD_TMPL = "{base}/prepare_store_download"
+    _BIOCOMPUTE_TMPL = "{base}/biocompute"
+    _WAIT_TMPL = "{base}/wait"
+
     def __init__(self, galaxy_instance: "GalaxyInstance") -> None:
         super().__init__(galaxy_instance)
+        # Whether the Galaxy server supports long-polling on invocations,
+        # determined on first use (``None`` means not probed yet)
+        self._longpoll_supported: Optional[bool] = None
+        # Cache of invocation details keyed on invocation ID, mapping to an
+        # (expiry, invocation) tuple. The representation of an invocation in a
+        # terminal state is immutable, so those entries never expire; others
+        # are kept for ``SHOW_CACHE_TTL`` seconds.
+        self._show_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # Cache of invocation base URLs keyed on invocation ID
+        self._url_cache: Dict[str, str] = {}
+        # Guards insertion into (and eviction from) the caches above, which
+        # can happen concurrently from the thread pools used by the waiting
+        # and batch methods
+        self._cache_lock = threading.Lock()
+        # Shared HTTP/2 client, created lazily on first use
+        self._http2_client: Optional[httpx.Client] = None
+        self._http2_unavailable = False
+        # Set by cancel_waits() to abort in-progress waiting methods
+        self._cancel_waits_event = threading.Event()
 
     def get_invocations(
         self,
@@ -65,7 +156,8 @@ class InvocationClient(Client):
 
         :type limit: int
         :param limit: Maximum number of invocations to return - if specified,
-                      the most recent invocations will be returned.
+                      the most recent invocations will be returned. ``0`` is a
+                      valid value and returns an empty list.
 
         :type view: str
         :param view: Level of detail to return per invocation, either
@@ -87,17 +179,115 @@ class InvocationClient(Client):
               'uuid': 'c8aa2b1c-801a-11e5-a9e5-8ca98228593c',
               'workflow_id': '03501d7626bd192f'}]
         """
-        params = {"include_terminal": include_terminal, "view": view, "step_details": step_details}
-        if workflow_id:
-            params["workflow_id"] = workflow_id
-        if history_id:
-            params["history_id"] = history_id
-        if user_id:
-            params["user_id"] = user_id
-        if limit is not None:
-            params["limit"] = limit
+        params = self._get_invocations_params(
+            workflow_id, history_id, user_id, include_terminal, limit, view, step_details
+        )
         return self._get(params=params)
 
+    @staticmethod
+    def _get_invocations_params(
+        workflow_id: Optional[str],
+        history_id: Optional[str],
+        user_id: Optional[str],
+        include_terminal: bool,
+        limit: Optional[int],
+        view: str,
+        step_details: bool,
+    ) -> Dict[str, Any]:
+        raw_params = {
+            "workflow_id": workflow_id,
+            "history_id": history_id,
+            "user_id": user_id,
+            "limit": limit,
+            "include_terminal": include_terminal,
+            "view": view,
+            "step_details": step_details,
+        }
+        return {k: v for k, v in raw_params.items() if v is not None}
+
+    def iter_invocations(
+        self,
+        workflow_id: Optional[str] = None,
+        history_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        include_terminal: bool = True,
+        limit: Optional[int] = None,
+        view: str = "collection",
+        step_details: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Get workflow invocations as ``get_invocations()`` does, but return
+        them as a generator. If the ijson package is installed, the response
+        is parsed incrementally while it is downloaded: each invocation is
+        yielded as soon as its bytes arrive, peak memory stays proportional to
+        a single invocation instead of the whole response, and iteration can
+        be abandoned early without decoding the rest. Without ijson, this
+        falls back to iterating over the ``get_invocations()`` response. For
+        documentation of the filtering parameters, see the
+        ``get_invocations()`` method.
+
+        :rtype: iterator of dicts
+        :return: An iterator over workflow invocations.
+        """
+        params = self._get_invocations_params(
+            workflow_id, history_id, user_id, include_terminal, limit, view, step_details
+        )
+        if ijson is None:
+            yield from self._get(params=params)
+            return
+        with self.gi.make_get_request(self._make_url(), params=params, stream=True) as r:
+            if r.status_code != 200:
+                raise ConnectionError(
+                    f"GET: error {r.status_code}: {r.content!r}",
+                    body=r.text,
+                    status_code=r.status_code,
+                )
+            r.raw.decode_content = True
+            yield from ijson.items(r.raw, "item")
+
+    def get_invocations_with_summaries(
+        self,
+        workflow_id: Optional[str] = None,
+        history_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        include_terminal: bool = True,
+        limit: Optional[int] = None,
+        view: str = "collection",
+        step_details: bool = False,
+        max_workers: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get workflow invocations as ``get_invocations()`` does, attaching to
+        each invocation its job summary under a 'summary' key. The summaries
+        are fetched concurrently, so building e.g. a dashboard view does not
+        pay one round-trip per invocation. For documentation of the filtering
+        parameters, see the ``get_invocations()`` method.
+
+        :type max_workers: int
+        :param max_workers: Maximum number of concurrent requests used to
+          fetch the invocation summaries.
+
+        :rtype: list
+        :return: A list of workflow invocations, each with an added 'summary'
+          key containing the corresponding ``get_invocation_summary()``
+          dictionary.
+        """
+        invocations = self.get_invocations(
+            workflow_id=workflow_id,
+            history_id=history_id,
+            user_id=user_id,
+            include_terminal=include_terminal,
+            limit=limit,
+            view=view,
+            step_details=step_details,
+        )
+        if invocations:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(invocations))) as executor:
+                summaries = executor.map(self.get_invocation_summary, [inv["id"] for inv in invocations])
+                for invocation, summary in zip(invocations, summaries):
+                    invocation["summary"] = summary
+        return invocations
+
     def show_invocation(self, invocation_id: str) -> Dict[str, Any]:
         """
         Get a workflow invocation dictionary representing the scheduling of a
@@ -142,9 +332,156 @@ class InvocationClient(Client):
              'update_time': '2015-10-31T22:00:26',
              'uuid': 'c8aa2b1c-801a-11e5-a9e5-8ca98228593c',
              'workflow_id': '03501d7626bd192f'}
+
+        .. note::
+          Invocation details are cached: once an invocation has been seen in a
+          terminal state, repeated calls return the cached representation
+          without contacting the Galaxy server. Details of an invocation in a
+          non-terminal state are cached for up to 2 seconds, so calls in quick
+          succession (e.g. from a custom polling loop) may return a slightly
+          stale representation. Use ``invalidate_invocation()`` to drop the
+          cached entry and force a fresh fetch.
         """
-        url = self._make_url(invocation_id)
-        return self._get(url=url)
+        cached = self._show_cache.get(invocation_id)
+        if cached is not None:
+            expiry, invocation = cached
+            if time.monotonic() < expiry:
+                # Return a copy, so that callers mutating the returned dict
+                # (e.g. to update the inputs before a rerun) cannot corrupt
+                # the cached representation
+                return copy.deepcopy(invocation)
+        return self._fetch_invocation(invocation_id)
+
+    def _fetch_invocation(self, invocation_id: str) -> Dict[str, Any]:
+        """
+        Fetch invocation details from the Galaxy server, bypassing the cache,
+        and store the response in the cache.
+        """
+        url = self._inv_url(invocation_id)
+        invocation = self._get(url=url)
+        self._cache_invocation(invocation_id, invocation)
+        return invocation
+
+    def _show_invocation_state(self, invocation_id: str) -> Dict[str, Any]:
+        """
+        Fetch a lightweight invocation representation: Galaxy's 'collection'
+        view omits the step list, which for large workflows dominates the
+        response size. Used by the poll loop, which only reads the state. The
+        response is partial, so it is not stored in the cache.
+        """
+        return self._get(url=self._inv_url(invocation_id), params={"view": "collection"})
+
+    def _get_http2_client(self) -> Optional["httpx.Client"]:
+        """
+        Return a shared client which multiplexes concurrent requests over a
+        single HTTP/2 connection, or ``None`` if the httpx package is not
+        installed with HTTP/2 support.
+        """
+        if httpx is None or self._http2_unavailable:
+            return None
+        if self._http2_client is None:
+            headers = {k: v for k, v in self.gi.json_headers.items() if isinstance(v, str)}
+            try:
+                self._http2_client = httpx.Client(
+                    http2=True,
+                    headers=headers,
+                    verify=self.gi.verify,
+                    timeout=self.gi.timeout,
+                    limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+                )
+            except ImportError:
+                # httpx is installed without the http2 extra
+                self._http2_unavailable = True
+                return None
+        return self._http2_client
+
+    def _http2_get(
+        self, client: "httpx.Client", invocation_id: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        GET an invocation through the shared HTTP/2 client and return the
+        decoded response. Mirrors the retry behaviour of ``Client._get()``,
+        as configured by gi's ``max_get_attempts`` and ``get_retry_delay``.
+        """
+        url = self._inv_url(invocation_id)
+        attempts_left = self.gi.max_get_attempts
+        retry_delay = self.gi.get_retry_delay
+        while True:
+            attempts_left -= 1
+            body: Optional[str] = None
+            status_code: Optional[int] = None
+            try:
+                r = client.get(url, params=params)
+            except httpx.HTTPError as e:
+                msg = str(e)
+            else:
+                body = r.text
+                status_code = r.status_code
+                if r.status_code == 200:
+                    try:
+                        return _json_loads(r.content)
+                    except ValueError:
+                        msg = f"GET: invalid JSON : {r.content!r}"
+                else:
+                    msg = f"GET: error {r.status_code}: {r.content!r}"
+            msg = f"{msg}, {attempts_left} attempts left"
+            if attempts_left <= 0:
+                log.error(msg)
+                raise ConnectionError(msg, body=body, status_code=status_code)
+            log.warning(msg)
+            time.sleep(retry_delay)
+
+    def _fetch_invocation_http2(self, client: "httpx.Client", invocation_id: str) -> Dict[str, Any]:
+        """
+        Same as ``_fetch_invocation()``, but issue the request through the
+        shared HTTP/2 client.
+        """
+        invocation = self._http2_get(client, invocation_id)
+        self._cache_invocation(invocation_id, invocation)
+        return invocation
+
+    def _show_invocation_state_http2(self, client: "httpx.Client", invocation_id: str) -> Dict[str, Any]:
+        """
+        Same as ``_show_invocation_state()``, but issue the request through
+        the shared HTTP/2 client. As with the requests-based variant, the
+        partial response is not stored in the cache.
+        """
+        return self._http2_get(client, invocation_id, params={"view": "collection"})
+
+    def close(self) -> None:
+        """
+        Close the shared HTTP/2 client, if one was created. The client remains
+        usable afterwards: the HTTP/2 client is recreated lazily if needed
+        again.
+        """
+        if self._http2_client is not None:
+            self._http2_client.close()
+            self._http2_client = None
+
+    def _cache_invocation(self, invocation_id: str, invocation: Dict[str, Any]) -> None:
+        # Store a private copy: the original dict is returned to the caller,
+        # which is free to modify it
+        invocation = copy.deepcopy(invocation)
+        if invocation.get("state") in INVOCATION_TERMINAL_STATES:
+            expiry = math.inf
+        else:
+            expiry = time.monotonic() + SHOW_CACHE_TTL
+        with self._cache_lock:
+            self._show_cache.pop(invocation_id, None)
+            while len(self._show_cache) >= SHOW_CACHE_MAXSIZE:
+                # Evict the oldest stored entry
+                self._show_cache.pop(next(iter(self._show_cache)))
+            self._show_cache[invocation_id] = (expiry, invocation)
+
+    def invalidate_invocation(self, invocation_id: str) -> None:
+        """
+        Drop any cached details for an invocation, forcing the next
+        ``show_invocation()`` call to fetch them from the Galaxy server.
+
+        :type invocation_id: str
+        :param invocation_id: Encoded workflow invocation ID
+        """
+        self._show_cache.pop(invocation_id, None)
 
     def rerun_invocation(
         self,
@@ -258,7 +595,8 @@ class InvocationClient(Client):
         :rtype: dict
         :return: The workflow invocation being cancelled
         """
-        url = self._make_url(invocation_id)
+        self.invalidate_invocation(invocation_id)
+        url = self._inv_url(invocation_id)
         return self._delete(url=url)
 
     def show_invocation_step(self, invocation_id: str, step_id: str) -> Dict[str, Any]:
@@ -312,7 +650,9 @@ class InvocationClient(Client):
         payload = {"action": action}
         return self._put(payload=payload, url=url)
 
-    def get_invocation_summary(self, invocation_id: str) -> Dict[str, Any]:
+    get_invocation_summary = _make_sub_resource_getter(
+        "get_invocation_summary",
+        "jobs_summary",
         """
         Get a summary of an invocation, stating the number of jobs which
         succeed, which are paused and which have errored.
@@ -328,11 +668,12 @@ class InvocationClient(Client):
              'model': 'WorkflowInvocation',
              'id': 'a799d38679e985db',
              'populated_state': 'ok'}
-        """
-        url = self._make_url(invocation_id) + "/jobs_summary"
-        return self._get(url=url)
+        """,
+    )
 
-    def get_invocation_step_jobs_summary(self, invocation_id: str) -> List[Dict[str, Any]]:
+    get_invocation_step_jobs_summary = _make_sub_resource_getter(
+        "get_invocation_step_jobs_summary",
+        "step_jobs_summary",
         """
         Get a detailed summary of an invocation, listing all jobs with
         their job IDs and current states.
@@ -356,11 +697,38 @@ class InvocationClient(Client):
               'model': 'Job',
               'populated_state': 'ok',
               'states': {'new': 1}}]
+        """,
+    )
+
+    def get_invocation_job_state_counts(self, invocation_id: str) -> Dict[str, Dict[str, int]]:
         """
-        url = self._make_url(invocation_id) + "/step_jobs_summary"
-        return self._get(url=url)
+        Get overall job state counts for an invocation, aggregated over all its
+        step jobs in a single pass.
+
+        :type invocation_id: str
+        :param invocation_id: Encoded workflow invocation ID
 
-    def get_invocation_report(self, invocation_id: str) -> Dict[str, Any]:
+        :rtype: dict
+        :return: A dictionary with a 'states' key mapping each job state to the
+          number of jobs in that state, and a 'populated_states' key doing the
+          same for the job populated states.
+          For example::
+
+            {'states': {'ok': 2, 'running': 1},
+             'populated_states': {'ok': 3}}
+        """
+        states: Dict[str, int] = Counter()
+        populated_states: Dict[str, int] = Counter()
+        for job_summary in self.get_invocation_step_jobs_summary(invocation_id):
+            states.update(job_summary.get("states", {}))
+            populated_state = job_summary.get("populated_state")
+            if populated_state:
+                populated_states[populated_state] += 1
+        return {"states": dict(states), "populated_states": dict(populated_states)}
+
+    get_invocation_report = _make_sub_resource_getter(
+        "get_invocation_report",
+        "report",
         """
         Get a Markdown report for an invocation.
 
@@ -377,9 +745,8 @@ class InvocationClient(Client):
              workflow_display(workflow_id=f2db41e1fa331b3e)\\n```\\n',
              'render_format': 'markdown',
              'workflows': {'f2db41e1fa331b3e': {'name': 'Example workflow'}}}
-        """
-        url = self._make_url(invocation_id) + "/report"
-        return self._get(url=url)
+        """,
+    )
 
     def get_invocation_report_pdf(self, invocation_id: str, file_path: str, chunk_size: int = CHUNK_SIZE) -> None:
         """
@@ -391,15 +758,17 @@ class InvocationClient(Client):
         :type file_path: str
         :param file_path: Path to save the report
         """
-        url = self._make_url(invocation_id) + "/report.pdf"
-        r = self.gi.make_get_request(url, stream=True)
-        if r.status_code != 200:
-            raise Exception(
-                "Failed to get the PDF report, the necessary dependencies may not be installed on the Galaxy server."
-            )
-        with open(file_path, "wb") as outf:
-            for chunk in r.iter_content(chunk_size):
-                outf.write(chunk)
+        url = self._REPORT_PDF_TMPL.format(base=self._inv_url(invocation_id))
+        with self.gi.make_get_request(url, stream=True) as r:
+            if r.status_code != 200:
+                raise Exception(
+                    "Failed to get the PDF report, the necessary dependencies may not be installed on the Galaxy server."
+                )
+            r.raw.decode_content = True
+            # Copy the raw stream to a large-buffered file object: both loops
+            # run in C, avoiding a Python-level iteration per chunk
+            with open(file_path, "wb", buffering=1 << 20) as outf:
+                shutil.copyfileobj(r.raw, outf, length=chunk_size)
 
     # TODO: Move to a new ``bioblend.galaxy.short_term_storage`` module
     def _wait_for_short_term_storage(
@@ -447,7 +816,7 @@ class InvocationClient(Client):
         :rtype: dict
         :return: The BioCompute object
         """
-        url = self._make_url(invocation_id) + "/prepare_store_download"
+        url = self._PREPARE_STORE_DOWNLOAD_TMPL.format(base=self._inv_url(invocation_id))
         payload = {"model_store_format": "bco.json"}
         try:
             psd = self._post(url=url, payload=payload)
@@ -455,7 +824,7 @@ class InvocationClient(Client):
             if e.status_code not in (400, 404):
                 raise
             # Galaxy release_22.05 and earlier
-            url = self._make_url(invocation_id) + "/biocompute"
+            url = self._BIOCOMPUTE_TMPL.format(base=self._inv_url(invocation_id))
             return self._get(url=url)
         else:
             storage_request_id = psd["storage_request_id"]
@@ -463,7 +832,12 @@ class InvocationClient(Client):
             return self._wait_for_short_term_storage(storage_request_id, maxwait=maxwait)
 
     def wait_for_invocation(
-        self, invocation_id: str, maxwait: float = 12000, interval: float = 3, check: bool = True
+        self,
+        invocation_id: str,
+        maxwait: float = 12000,
+        interval: float = 3,
+        check: bool = True,
+        mode: WaitMode = "poll",
     ) -> Dict[str, Any]:
         """
         Wait until an invocation is in a terminal state.
@@ -477,29 +851,339 @@ class InvocationClient(Client):
           raised.
 
         :type interval: float
-        :param interval: Time (in seconds) to wait between 2 consecutive checks.
+        :param interval: Maximum time (in seconds) to wait between 2
+          consecutive checks. Polling starts with a short interval which is
+          roughly doubled (with a small random jitter) after each check, up to
+          this value. Ignored when long-polling is used.
 
         :type check: bool
         :param check: Whether to check if the invocation terminal state is
           'scheduled'.
 
+        :type mode: str
+        :param mode: How to wait for the invocation, either 'poll' (the
+          default: check the invocation state at regular intervals),
+          'longpoll' (issue requests which are held open by the Galaxy server
+          until the invocation state changes) or 'auto' (try long-polling
+          first, falling back to polling if the server does not support it or
+          the long-polling request fails).
+
         :rtype: dict
         :return: Details of the workflow invocation.
         """
-
-        def check_and_get_invocation() -> Dict[str, Any]:
-            invocation = self.gi.invocations.show_invocation(invocation_id)
+        assert maxwait >= 0
+        assert interval > 0
+        if mode not in ("auto", "poll", "longpoll"):
+            raise ValueError(f"Invalid mode: {mode!r}")
+        self._cancel_waits_event.clear()
+
+        if mode == "longpoll" or (mode == "auto" and self._longpoll_supported is not False):
+            try:
+                return self._wait_for_invocation_longpoll(invocation_id, maxwait=maxwait, check=check)
+            except ConnectionError as e:
+                if mode == "longpoll":
+                    raise
+                if e.status_code in (400, 404):
+                    # The Galaxy server does not implement long-polling on
+                    # invocations, remember that and fall back to polling
+                    self._longpoll_supported = False
+                else:
+                    # Transient failure (e.g. a proxy error): fall back to
+                    # polling for this wait without writing off the endpoint
+                    log.warning("Long-polling invocation %s failed (%s), falling back to polling", invocation_id, e)
+            except requests.exceptions.RequestException as e:
+                if mode == "longpoll":
+                    raise
+                log.warning("Long-polling invocation %s failed (%s), falling back to polling", invocation_id, e)
+        return self._wait_for_invocation_poll(invocation_id, maxwait=maxwait, interval=interval, check=check)
+
+    def _wait_for_invocation_longpoll(self, invocation_id: str, maxwait: float, check: bool) -> Dict[str, Any]:
+        """
+        Wait until an invocation is in a terminal state by issuing requests
+        which the Galaxy server holds open until the invocation state changes
+        or a server-side timeout expires. Compared to polling, this needs one
+        request per state transition instead of one per ``interval``.
+        """
+        url = self._WAIT_TMPL.format(base=self._inv_url(invocation_id))
+        deadline = time.monotonic() + maxwait
+        while True:
+            # A long-polling request in flight cannot be interrupted, so
+            # cancellation takes effect between requests
+            if self._cancel_waits_event.is_set():
+                raise WaitCancelled(f"Waiting for invocation {invocation_id} was cancelled")
+            server_timeout = min(LONGPOLL_SERVER_TIMEOUT, max(deadline - time.monotonic(), 1))
+            # The client-side timeout must exceed the server-side one, so the
+            # connection is not dropped while the server is holding the request
+            r = self.gi.make_get_request(url, params={"timeout": server_timeout}, timeout=server_timeout + 5)
+            if r.status_code != 200:
+                raise ConnectionError(
+                    f"GET: error {r.status_code}: {r.content!r}",
+                    body=r.text,
+                    status_code=r.status_code,
+                )
+            self._longpoll_supported = True
+            invocation = r.json()
+            self._cache_invocation(invocation_id, invocation)
             state = invocation["state"]
             if state in INVOCATION_TERMINAL_STATES:
                 if check and state != "scheduled":
                     raise Exception(f"Invocation {invocation_id} is in terminal state {state}")
                 return invocation
-            raise NotReady(f"Invocation {invocation_id} is in non-terminal state {state}")
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"Invocation {invocation_id} is in non-terminal state {state} after {maxwait} s")
+            log.info("Invocation %s is in non-terminal state %s. Will keep waiting", invocation_id, state)
+
+    def _wait_for_invocation_poll(
+        self, invocation_id: str, maxwait: float, interval: float, check: bool
+    ) -> Dict[str, Any]:
+        """
+        Wait until an invocation is in a terminal state by checking its state
+        at exponentially growing intervals.
+        """
+        # Hoist the attribute lookups out of the loop
+        fetch_state = self._show_invocation_state
+        is_terminal = INVOCATION_TERMINAL_STATES.__contains__
+        monotonic = time.monotonic
+        delay = min(0.25, interval)
+        deadline = monotonic() + maxwait
+        while True:
+            # Poll with the lightweight 'collection' view (no step list) and
+            # without the cache, so that a state change is never missed
+            # because a cached non-terminal representation is still fresh
+            state = fetch_state(invocation_id)["state"]
+            if is_terminal(state):
+                if check and state != "scheduled":
+                    raise Exception(f"Invocation {invocation_id} is in terminal state {state}")
+                # Return the full invocation details, as before the
+                # lightweight polling was introduced
+                return self._fetch_invocation(invocation_id)
+            time_left = deadline - monotonic()
+            if time_left <= 0:
+                raise TimeoutException(f"Invocation {invocation_id} is in non-terminal state {state} after {maxwait} s")
+            log.info("Invocation %s is in non-terminal state %s. Will wait %s more s", invocation_id, state, time_left)
+            # Event.wait() instead of time.sleep(), so that cancel_waits()
+            # wakes the loop immediately instead of after up to ``interval`` s
+            if self._cancel_waits_event.wait(timeout=min(delay, time_left)):
+                raise WaitCancelled(f"Waiting for invocation {invocation_id} was cancelled")
+            # Exponential backoff with jitter, capped at ``interval``
+            delay = min(delay * 2, interval) * random.uniform(0.9, 1.1)
+
+    def invoke_and_wait(
+        self,
+        workflow_id: str,
+        inputs: Optional[dict] = None,
+        params: Optional[dict] = None,
+        history_id: Optional[str] = None,
+        history_name: Optional[str] = None,
+        import_inputs_to_history: bool = False,
+        replacement_params: Optional[dict] = None,
+        allow_tool_state_corrections: bool = False,
+        inputs_by: Optional[InputsBy] = None,
+        parameters_normalized: bool = False,
+        require_exact_tool_versions: bool = True,
+        maxwait: float = 12000,
+        interval: float = 3,
+        fetch_outputs: bool = True,
+        max_workers: int = 8,
+    ) -> Dict[str, Any]:
+        """
+        Invoke the workflow identified by ``workflow_id``, wait until the
+        invocation is in a terminal state, and optionally fetch the details of
+        its output datasets and dataset collections. This combines the usual
+        ``invoke_workflow()`` -> ``wait_for_invocation()`` -> fetch outputs
+        chain into a single call, with the output details fetched concurrently
+        instead of one request at a time. For documentation of the invocation
+        parameters, see the ``gi.workflows.invoke_workflow()`` method.
 
-        return wait_on(check_and_get_invocation, maxwait=maxwait, interval=interval)
+        :type workflow_id: str
+        :param workflow_id: Encoded workflow ID
+
+        :type maxwait: float
+        :param maxwait: Total time (in seconds) to wait for the invocation
+          state to become terminal. After this time, a ``TimeoutException``
+          will be raised.
+
+        :type interval: float
+        :param interval: Maximum time (in seconds) to wait between 2
+          consecutive checks of the invocation state.
+
+        :type fetch_outputs: bool
+        :param fetch_outputs: Whether to fetch the details of the invocation
+          output datasets and dataset collections.
+
+        :type max_workers: int
+        :param max_workers: Maximum number of concurrent requests used to
+          fetch the output details.
+
+        :rtype: dict
+        :return: A dictionary with the following keys:
+
+          - 'invocation': the terminal workflow invocation details
+          - 'outputs': a mapping from output labels to dataset details
+          - 'output_collections': a mapping from output labels to dataset
+            collection details
+        """
+        invocation = self.gi.workflows.invoke_workflow(
+            workflow_id,
+            inputs=inputs,
+            params=params,
+            history_id=history_id,
+            history_name=history_name,
+            import_inputs_to_history=import_inputs_to_history,
+            replacement_params=replacement_params,
+            allow_tool_state_corrections=allow_tool_state_corrections,
+            inputs_by=inputs_by,
+            parameters_normalized=parameters_normalized,
+            require_exact_tool_versions=require_exact_tool_versions,
+        )
+        invocation = self.wait_for_invocation(invocation["id"], maxwait=maxwait, interval=interval)
+        result: Dict[str, Any] = {"invocation": invocation, "outputs": {}, "output_collections": {}}
+        if fetch_outputs:
+            outputs = invocation.get("outputs", {})
+            output_collections = invocation.get("output_collections", {})
+            n_outputs = len(outputs) + len(output_collections)
+            if n_outputs:
+                with ThreadPoolExecutor(max_workers=min(max_workers, n_outputs)) as executor:
+                    dataset_futures = {
+                        label: executor.submit(self.gi.datasets.show_dataset, output["id"])
+                        for label, output in outputs.items()
+                    }
+                    collection_futures = {
+                        label: executor.submit(self.gi.dataset_collections.show_dataset_collection, output["id"])
+                        for label, output in output_collections.items()
+                    }
+                    result["outputs"] = {label: future.result() for label, future in dataset_futures.items()}
+                    result["output_collections"] = {
+                        label: future.result() for label, future in collection_futures.items()
+                    }
+        return result
+
+    def wait_for_invocations(
+        self,
+        invocation_ids: List[str],
+        maxwait: float = 12000,
+        interval: float = 3,
+        check: bool = True,
+        max_workers: int = 8,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Wait until all the given invocations are in a terminal state.
+
+        Compared to calling ``wait_for_invocation()`` in a loop, each poll
+        cycle checks all the pending invocations concurrently, so the total
+        waiting time does not grow linearly with the number of invocations.
+
+        :type invocation_ids: list of str
+        :param invocation_ids: Invocation IDs to wait for.
+
+        :type maxwait: float
+        :param maxwait: Total time (in seconds) to wait for all the invocation
+          states to become terminal. After this time, a ``TimeoutException``
+          will be raised.
+
+        :type interval: float
+        :param interval: Maximum time (in seconds) to wait between 2
+          consecutive check cycles.
+
+        :type check: bool
+        :param check: Whether to check if the invocation terminal states are
+          'scheduled'.
+
+        :type max_workers: int
+        :param max_workers: Maximum number of concurrent requests to issue per
+          check cycle.
+
+        :rtype: dict
+        :return: A mapping from invocation IDs to the corresponding workflow
+          invocation details.
+        """
+        assert maxwait >= 0
+        assert interval > 0
+
+        self._cancel_waits_event.clear()
+        invocations: Dict[str, Dict[str, Any]] = {}
+        # Deduplicate while preserving the order in which IDs are polled
+        pending = list(dict.fromkeys(invocation_ids))
+        if not pending:
+            return invocations
+        delay = min(0.25, interval)
+        deadline = time.monotonic() + maxwait
+        http2_client = self._get_http2_client()
+        fetch_state: Callable[[str], Dict[str, Any]]
+        fetch_full: Callable[[str], Dict[str, Any]]
+        if http2_client is not None:
+            fetch_state = functools.partial(self._show_invocation_state_http2, http2_client)
+            fetch_full = functools.partial(self._fetch_invocation_http2, http2_client)
+        else:
+            fetch_state = self._show_invocation_state
+            fetch_full = self._fetch_invocation
+        # The Galaxy API has no filter to fetch an arbitrary set of invocation
+        # IDs in a single request, so overlap the individual state checks
+        # (which are I/O bound) on a thread pool instead.
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            while True:
+                # Poll with the lightweight 'collection' view (no step list);
+                # the full representation is fetched only once, when an
+                # invocation has reached a terminal state
+                terminal_ids = []
+                for invocation_id, invocation in zip(pending, executor.map(fetch_state, pending)):
+                    state = invocation["state"]
+                    if state in INVOCATION_TERMINAL_STATES:
+                        if check and state != "scheduled":
+                            raise Exception(f"Invocation {invocation_id} is in terminal state {state}")
+                        terminal_ids.append(invocation_id)
+                if terminal_ids:
+                    for invocation_id, invocation in zip(terminal_ids, executor.map(fetch_full, terminal_ids)):
+                        invocations[invocation_id] = invocation
+                pending = [invocation_id for invocation_id in pending if invocation_id not in invocations]
+                if not pending:
+                    return invocations
+                time_left = deadline - time.monotonic()
+                if time_left <= 0:
+                    raise TimeoutException(
+                        f"Invocation(s) {', '.join(pending)} are in non-terminal states after {maxwait} s"
+                    )
+                log.info("%s invocation(s) are in non-terminal states. Will wait %s more s", len(pending), time_left)
+                if self._cancel_waits_event.wait(timeout=min(delay, time_left)):
+                    raise WaitCancelled(f"Waiting for invocation(s) {', '.join(pending)} was cancelled")
+                delay = min(delay * 2, interval) * random.uniform(0.9, 1.1)
+
+    def cancel_waits(self) -> None:
+        """
+        Cancel the in-progress ``wait_for_invocation()`` and
+        ``wait_for_invocations()`` calls of this client: they will promptly
+        raise ``bioblend.WaitCancelled`` instead of sleeping until their next
+        check. Meant to be called from another thread (e.g. to abort a long
+        wait without killing the whole process); waiting calls started
+        afterwards are not affected.
+        """
+        self._cancel_waits_event.set()
+
+    def _inv_url(self, invocation_id: str) -> str:
+        """
+        Return the base URL for an invocation, cached so that fetching several
+        sub-resources of the same invocation builds the URL only once.
+        """
+        url = self._url_cache.get(invocation_id)
+        if url is None:
+            url = self._make_url(invocation_id)
+            with self._cache_lock:
+                while len(self._url_cache) >= URL_CACHE_MAXSIZE:
+                    # Evict the oldest stored entry
+                    self._url_cache.pop(next(iter(self._url_cache)))
+                self._url_cache[invocation_id] = url
+        return url
+
+    def _steps_url_base(self, invocation_id: str) -> str:
+        """
+        Return the base URL for the steps of an invocation. Bulk-step helpers
+        should call this once and append each step ID, instead of building the
+        invocation part of the URL once per step.
+        """
+        return f"{self._inv_url(invocation_id)}/steps"
 
     def _invocation_step_url(self, invocation_id: str, step_id: str) -> str:
-        return "/".join((self._make_url(invocation_id), "steps", step_id))
+        return f"{self._steps_url_base(invocation_id)}/{step_id}"
 
 
 __all__ = ("InvocationClient",)
@@ -10,6 +10,7 @@ import base64
 import contextlib
 import json
 import logging
+import socket
 from typing import (
     Any,
     Dict,
@@ -22,7 +23,9 @@ import tusclient.client
 import tusclient.exceptions
 import tusclient.storage.filestorage
 import tusclient.uploader
+from requests.adapters import HTTPAdapter
 from requests_toolbelt import MultipartEncoder
+from urllib3.connection import HTTPConnection
 
 from bioblend import ConnectionError
 from bioblend.util import FileStream
@@ -32,6 +35,24 @@ log = logging.getLogger(__name__)
 UPLOAD_CHUNK_SIZE = 10**7
 
 
+class BioBlendHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter with a larger connection pool and keep-alive friendly socket
+    options, so that consecutive requests to the same Galaxy server (e.g. when
+    polling an invocation state) reuse established TCP connections instead of
+    paying a TCP+TLS handshake each time.
+    """
+
+    # urllib3's default socket options already include TCP_NODELAY
+    _socket_options = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
 class GalaxyClient:
     def __init__(
         self,
@@ -73,6 +94,12 @@ class GalaxyClient:
         self.base_url = url.rstrip("/")
         # All of Galaxy's and ToolShed's API's are rooted at <url>/api so make that the url
         self.url = f"{self.base_url}/api"
+        # Use a session so that requests to the same server reuse pooled
+        # keep-alive connections
+        self.session = requests.Session()
+        adapter = BioBlendHTTPAdapter(pool_connections=32, pool_maxsize=64, pool_block=False)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         # If key has been supplied, use it; otherwise just set email and
         # password and grab user's key before first request.
         if key:
@@ -140,7 +167,7 @@ class GalaxyClient:
         headers = self.json_headers
         kwargs.setdefault("timeout", self.timeout)
         kwargs.setdefault("verify", self.verify)
-        r = requests.get(url, headers=headers, **kwargs)
+        r = self.session.get(url, headers=headers, **kwargs)
         return r
 
     def make_post_request(
@@ -181,7 +208,7 @@ class GalaxyClient:
             headers = self.json_headers
             post_params = params
 
-        r = requests.post(
+        r = self.session.post(
             url,
             params=post_params,
             data=data,
@@ -221,7 +248,7 @@ class GalaxyClient:
         """
         data = json.dumps(payload) if payload is not None else None
         headers = self.json_headers
-        r = requests.delete(
+        r = self.session.delete(
             url,
             params=params,
             data=data,
@@ -243,7 +270,7 @@ class GalaxyClient:
         """
         data = json.dumps(payload) if payload is not None else None
         headers = self.json_headers
-        r = requests.put(
+        r = self.session.put(
             url,
             params=params,
             data=data,
@@ -279,7 +306,7 @@ class GalaxyClient:
         """
         data = json.dumps(payload) if payload is not None else None
         headers = self.json_headers
-        r = requests.patch(
+        r = self.session.patch(
             url,
             params=params,
             data=data,
@@ -351,6 +378,20 @@ class GalaxyClient:
                 status_code=exc.status_code,
             )
 
+    def close(self) -> None:
+        """
+        Close the session used to issue requests, releasing its pooled
+        connections. The instance remains usable afterwards: a new connection
+        will be established for the next request.
+        """
+        self.session.close()
+
+    def __enter__(self) -> "GalaxyClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     @property
     def key(self) -> Optional[str]:
         if not self._key and self.email is not None and self.password is not None:
@@ -361,7 +402,7 @@ class GalaxyClient:
             auth_url = f"{self.url}/authenticate/baseauth"
             # Use lower level method instead of make_get_request() because we
             # need the additional Authorization header.
-            r = requests.get(
+            r = self.session.get(
                 auth_url,
                 headers=headers,
                 timeout=self.timeout,